@@ -1,16 +1,49 @@
 """Utilities for retrieving and filtering Chrome tab URLs."""
 from __future__ import annotations
 
-import json
+import functools
+import re
 import warnings
 from urllib.error import URLError
 from urllib.request import urlopen
-from urllib.parse import urlparse
 
-try:  # pragma: no cover - optional dependency
-    from yt_dlp.extractor import gen_extractors
-except ImportError:  # pragma: no cover - graceful degradation when yt_dlp missing
-    gen_extractors = None  # type: ignore[assignment]
+try:  # pragma: no cover - optional dependency, ~3x faster JSON decoding
+    import orjson as _json
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json as _json  # type: ignore[no-redef]
+
+try:  # pragma: no cover - optional dependency, enables connection reuse
+    import urllib3
+except ImportError:  # pragma: no cover - fall back to one-shot urlopen
+    urllib3 = None  # type: ignore[assignment]
+
+# Shared connection pool for the DevTools endpoint so repeated polls reuse
+# the existing socket instead of paying a TCP handshake per call. The endpoint
+# is loopback-only, so a refused/absent Chrome should fail fast on connect
+# while an answering Chrome still gets a generous read window.
+_POOL = (
+    urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        timeout=urllib3.Timeout(connect=0.5, read=3),
+        retries=False,
+    )
+    if urllib3 is not None
+    else None
+)
+
+_REQUEST_ERRORS: tuple[type[Exception], ...] = (URLError, ValueError, OSError)
+if urllib3 is not None:  # pragma: no cover - depends on optional dependency
+    _REQUEST_ERRORS += (urllib3.exceptions.HTTPError,)
+
+# Named groups must be stripped before extractor patterns can be merged into a
+# single alternation; duplicate group names would otherwise fail to compile.
+_NAMED_GROUP_RE = re.compile(r"\(\?P<[^>]+>")
+
+# Global inline flags such as ``(?x)``. Python 3.11+ only accepts them at the
+# very start of an expression, so they must be rewritten as scoped groups
+# before a pattern can be embedded in the fused alternation.
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
 
 __all__ = [
     "get_chrome_tabs",
@@ -25,34 +58,155 @@ def get_chrome_tabs(port: int = 9222) -> list[str]:
     The function queries Chrome's remote debugging endpoint and extracts the
     ``url`` field from each tab description.
     """
+    endpoint = f"http://127.0.0.1:{port}/json"
     try:
-        with urlopen(f"http://127.0.0.1:{port}/json", timeout=3) as response:
-            tabs = json.load(response)
-    except (URLError, json.JSONDecodeError):
+        if _POOL is not None:
+            tabs = _json.loads(_POOL.request("GET", endpoint).data)
+        else:
+            with urlopen(endpoint, timeout=3) as response:
+                tabs = _json.loads(response.read())
+    except _REQUEST_ERRORS:
         return []
 
-    return [tab.get("url", "") for tab in tabs if tab.get("url")]
+    return [url for tab in tabs if (url := tab.get("url"))]
+
+
+@functools.lru_cache(maxsize=1)
+def _supported_url_patterns() -> tuple[re.Pattern[str], ...]:
+    """Return compiled URL patterns for all non-generic ``yt_dlp`` extractors.
+
+    The extractor list is built once and, where possible, the individual
+    ``_VALID_URL`` expressions are fused into a single alternation so each URL
+    only needs one ``match`` call instead of one per extractor.
+    """
+    fusable: list[str] = []
+    standalone: list[re.Pattern[str]] = []
+    gen_extractors = _gen_extractors()
+    for extractor in gen_extractors():
+        if extractor.IE_NAME == "generic":
+            continue
+        valid_url = getattr(extractor, "_VALID_URL", None)
+        # ``_VALID_URL`` may be a single pattern, a list of alternative
+        # patterns, or a non-string sentinel such as ``False``; only string
+        # patterns are usable here.
+        if isinstance(valid_url, str):
+            candidates: tuple[str, ...] = (valid_url,)
+        elif isinstance(valid_url, (list, tuple)):
+            candidates = tuple(p for p in valid_url if isinstance(p, str))
+        else:
+            continue
+        for pattern in candidates:
+            sanitised = _sanitise_for_fusion(pattern)
+            if sanitised is not None:
+                fusable.append(sanitised)
+            else:
+                # Patterns that cannot be rewritten (named backreferences,
+                # non-scopeable flags) stay standalone instead.
+                try:
+                    standalone.append(re.compile(pattern))
+                except re.error:  # pragma: no cover - defensive
+                    pass
+
+    patterns: list[re.Pattern[str]] = []
+    if fusable:
+        combined = "|".join(f"(?:{pattern})" for pattern in fusable)
+        try:
+            patterns.append(re.compile(combined))
+        except re.error:  # pragma: no cover - fall back to per-extractor matching
+            patterns.extend(re.compile(pattern) for pattern in fusable)
+    patterns.extend(standalone)
+    return tuple(patterns)
+
+
+def _sanitise_for_fusion(pattern: str) -> str | None:
+    """Rewrite ``pattern`` so it can be embedded in the fused alternation.
+
+    Named groups are stripped (duplicate names across extractors would fail
+    to compile) and leading global inline flags like ``(?x)`` are converted
+    into a scoped flag group, since Python 3.11+ rejects global flags that
+    are no longer at the start of the combined expression.  Returns ``None``
+    when the pattern cannot be rewritten safely.
+    """
+    flags = ""
+    while (match := _GLOBAL_FLAGS_RE.match(pattern)) is not None:
+        flags += match.group(1)
+        pattern = pattern[match.end():]
+    if any(flag not in "imsx" for flag in flags):
+        # Only i/m/s/x are valid inside a scoped flag group.
+        return None
+    if _GLOBAL_FLAGS_RE.search(pattern):
+        # Global flags buried mid-pattern cannot be scoped mechanically.
+        return None
+    sanitised = _NAMED_GROUP_RE.sub("(?:", pattern)
+    if flags:
+        sanitised = f"(?{flags}:{sanitised})"
+    try:
+        re.compile(sanitised)
+    except re.error:
+        return None
+    return sanitised
+
+
+@functools.lru_cache(maxsize=1)
+def _gen_extractors():
+    """Return ``yt_dlp.extractor.gen_extractors`` or ``None`` if unavailable.
+
+    Importing ``yt_dlp.extractor`` loads hundreds of extractor classes, so the
+    import is deferred until URL filtering is actually requested instead of
+    happening when this module (and with it the GUI) is first imported.
+    """
+    try:  # pragma: no cover - optional dependency
+        from yt_dlp.extractor import gen_extractors
+    except ImportError:  # pragma: no cover - graceful degradation
+        return None
+    return gen_extractors
+
+
+def _is_service_worker(url: str) -> bool:
+    """Return whether ``url`` points at a service worker script.
+
+    Service workers are not downloadable media. Plain string slicing is used
+    instead of ``urlparse`` to avoid per-URL parse overhead and allocations.
+    """
+    path = url.partition("?")[0].partition("#")[0]
+    return path.lower().endswith("service-worker.js")
+
+
+@functools.lru_cache(maxsize=256)
+def _is_supported_url(url: str) -> bool:
+    """Return whether ``url`` matches a non-generic ``yt_dlp`` extractor.
+
+    Results are memoized because tab polling tends to see the same URLs
+    repeatedly; a cache hit skips the regex match entirely.
+    """
+    return any(pattern.match(url) for pattern in _supported_url_patterns())
 
 
 def filter_supported_urls(urls: list[str]) -> list[str]:
-    """Filter ``urls`` keeping only those supported by ``yt_dlp`` extractors."""
-    if gen_extractors is None:
+    """Filter ``urls`` keeping only those supported by ``yt_dlp`` extractors.
+
+    Support is detected purely with the extractors' compiled ``_VALID_URL``
+    patterns; no network request or ``YoutubeDL.extract_info`` call is made.
+    """
+    if _gen_extractors() is None:
         warnings.warn(
             "yt_dlp is required to detect supported URLs. Install it via 'pip install yt-dlp'.",
             RuntimeWarning,
         )
         return urls
 
-    extractors = gen_extractors()
     supported = []
-    for url in urls:
-        # Skip service worker scripts which are not downloadable media.
-        if urlparse(url).path.lower().endswith("service-worker.js"):
+    # Duplicate tabs (same page open twice) are collapsed up front so each
+    # distinct URL is matched - and later downloaded - only once.
+    for url in dict.fromkeys(urls):
+        # chrome://, devtools://, file:// and similar tabs can never be
+        # downloadable media, so skip them before any regex work.
+        if not url.startswith(("http://", "https://")):
+            continue
+        if _is_service_worker(url):
             continue
-        for extractor in extractors:
-            if extractor.suitable(url) and extractor.IE_NAME != "generic":
-                supported.append(url)
-                break
+        if _is_supported_url(url):
+            supported.append(url)
     return supported
 
 
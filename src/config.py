@@ -23,45 +23,80 @@ except Exception:  # pragma: no cover - provide minimal fallbacks
 
     def set_key(file_path: str, key: str, value: str) -> None:
         file = Path(file_path)
-        if file.exists():
-            lines = file.read_text(encoding="utf-8").splitlines()
-        else:
-            lines = []
-        updated = False
+        content = file.read_text(encoding="utf-8") if file.exists() else ""
+        lines = content.splitlines()
         for i, line in enumerate(lines):
             if line.split("=", 1)[0] == key:
                 lines[i] = f"{key}={value}"
-                updated = True
-                break
-        if not updated:
-            lines.append(f"{key}={value}")
-        file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                return
+        # New key: append instead of rewriting the whole file.
+        with file.open("a", encoding="utf-8") as f:
+            if content and not content.endswith("\n"):
+                f.write("\n")
+            f.write(f"{key}={value}\n")
 
-ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
-DEFAULT_OUTPUT_DIR = (Path(__file__).resolve().parent.parent / "summaries").resolve()
-DEFAULT_VIDEO_DIR = (Path(__file__).resolve().parent.parent / "videos").resolve()
+# Project root resolved once; every derived path hangs off this constant.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+ENV_PATH = PROJECT_ROOT / ".env"
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "summaries"
+DEFAULT_VIDEO_DIR = PROJECT_ROOT / "videos"
 
 # Load existing environment variables from .env if present
 load_dotenv(dotenv_path=ENV_PATH)
 
+# Cached directory values so the GUI's frequent reads avoid re-querying the
+# environment on every access; the setters keep the cache in sync.
+_cached_output_dir: str | None = None
+_cached_video_dir: str | None = None
+
 
 def get_default_output_dir() -> str:
     """Retrieve the default output directory from environment or fallback."""
-    return os.getenv("DEFAULT_OUTPUT_DIR", str(DEFAULT_OUTPUT_DIR))
+    global _cached_output_dir
+    if _cached_output_dir is None:
+        _cached_output_dir = os.getenv("DEFAULT_OUTPUT_DIR", str(DEFAULT_OUTPUT_DIR))
+    return _cached_output_dir
 
 
 def get_default_video_dir() -> str:
     """Return the default directory for downloaded videos."""
-    return os.getenv("DEFAULT_VIDEO_DIR", str(DEFAULT_VIDEO_DIR))
+    global _cached_video_dir
+    if _cached_video_dir is None:
+        _cached_video_dir = os.getenv("DEFAULT_VIDEO_DIR", str(DEFAULT_VIDEO_DIR))
+    return _cached_video_dir
 
 
 def set_default_output_dir(path: str) -> None:
-    """Persist a new default output directory to the .env file."""
+    """Persist a new default output directory to the .env file.
+
+    Writing is skipped when ``path`` already matches the current default so
+    repeated runs with an unchanged folder do not rewrite ``.env``.
+    """
+    global _cached_output_dir
+    if path == get_default_output_dir():
+        return
+    _cached_output_dir = path
     os.environ["DEFAULT_OUTPUT_DIR"] = path
     ENV_PATH.touch(exist_ok=True)
     set_key(str(ENV_PATH), "DEFAULT_OUTPUT_DIR", path)
 
 
+def get_last_audio_dir() -> str:
+    """Return the directory last used in the audio file chooser."""
+    return os.getenv("LAST_AUDIO_DIR", str(PROJECT_ROOT))
+
+
+def set_last_audio_dir(path: str) -> None:
+    """Persist the directory last used in the audio file chooser."""
+    if path == get_last_audio_dir():
+        return
+    os.environ["LAST_AUDIO_DIR"] = path
+    ENV_PATH.touch(exist_ok=True)
+    set_key(str(ENV_PATH), "LAST_AUDIO_DIR", path)
+
+
 def get_openai_api_key() -> str | None:
     """Return the OpenAI API key from environment or .env."""
     return os.getenv("OPENAI_API_KEY")
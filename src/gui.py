@@ -10,7 +10,13 @@ from tkinter import filedialog, messagebox, ttk
 import logging
 
 from browser_tabs import get_supported_chrome_tabs
-from config import get_default_output_dir, get_default_video_dir, set_default_output_dir
+from config import (
+    get_default_output_dir,
+    get_default_video_dir,
+    get_last_audio_dir,
+    set_default_output_dir,
+    set_last_audio_dir,
+)
 
 # ``process`` and its heavy dependencies are imported lazily in the background so
 # the GUI can appear quickly.
@@ -24,14 +30,22 @@ logging.basicConfig(
 )
 
 
-def load_process_module() -> None:
-    """Import the heavy ``process`` module in a background thread."""
+def load_process_module(preload_model: str | None = None) -> None:
+    """Import the heavy ``process`` module in a background thread.
+
+    When ``preload_model`` is given, the named Whisper model is loaded into
+    the cache right after the import so the first transcription does not
+    stall on model loading.
+    """
 
     global process
     try:
         process = importlib.import_module("process")
     except Exception as exc:  # pragma: no cover - import error path
         print(f"Failed to load dependencies: {exc}")
+        return
+    if preload_model:
+        process.preload_whisper_model(preload_model)
 
 
 def ensure_process_loaded() -> ModuleType:
@@ -47,6 +61,53 @@ def ensure_process_loaded() -> ModuleType:
 audio_files: list[str] = []
 
 
+def make_progress_updater(progress_var, status_var):
+    """Return a progress callback that coalesces updates into one Tk event.
+
+    Worker threads can report progress far faster than Tk needs to repaint.
+    Only the most recent percent/status pair is kept, and a single ``after``
+    callback is scheduled at a time instead of one per report.
+    """
+
+    pending = {"scheduled": False, "percent": 0.0, "status": None}
+    lock = threading.Lock()
+
+    def flush() -> None:
+        with lock:
+            pending["scheduled"] = False
+            percent = pending["percent"]
+            status = pending["status"]
+        progress_var.set(percent)
+        if status is not None:
+            status_var.set(status)
+
+    def update(percent: float, status: str | None = None) -> None:
+        with lock:
+            pending["percent"] = percent
+            if status is not None:
+                pending["status"] = status
+            if pending["scheduled"]:
+                return
+            pending["scheduled"] = True
+        root.after(0, flush)
+
+    return update
+
+
+def set_text_widget(widget: tk.Text, content: str) -> None:
+    """Replace the entire content of ``widget`` in a single Tk callback.
+
+    Scheduling the delete and insert together avoids an intermediate event
+    where the widget is empty and halves the number of queued callbacks.
+    """
+
+    def _replace() -> None:
+        widget.delete("1.0", tk.END)
+        widget.insert(tk.END, content)
+
+    root.after(0, _replace)
+
+
 def browse_output_dir() -> None:
     """Open a directory chooser and update the output directory selection."""
     path = filedialog.askdirectory(initialdir=output_dir_var.get())
@@ -58,12 +119,14 @@ def browse_output_dir() -> None:
 def browse_audio_file() -> None:
     """Open a file chooser and update the audio file selection."""
     paths = filedialog.askopenfilenames(
-        filetypes=[("Audio Files", "*.mp3 *.wav *.m4a *.flac *.ogg")]
+        initialdir=get_last_audio_dir(),
+        filetypes=[("Audio Files", "*.mp3 *.wav *.m4a *.flac *.ogg")],
     )
     if paths:
         audio_files.clear()
         audio_files.extend(paths)
         audio_file_var.set(f"{len(paths)} files selected")
+        set_last_audio_dir(str(Path(paths[0]).parent))
 
 
 def load_browser_tabs() -> None:
@@ -75,8 +138,7 @@ def load_browser_tabs() -> None:
         return
     if urls:
         url_text.delete("1.0", tk.END)
-        for url in urls:
-            url_text.insert(tk.END, f"{url}\n")
+        url_text.insert(tk.END, "".join(f"{url}\n" for url in urls))
     else:
         messagebox.showinfo(
             "No tabs found", "No supported browser tabs were detected."
@@ -97,17 +159,22 @@ def toggle_input_fields() -> None:
         audio_browse.config(state="normal")
 
 
+def get_url_sources() -> list[str]:
+    """Return the non-empty, stripped URLs from the URL text widget."""
+    return [
+        line
+        for raw in url_text.get("1.0", tk.END).splitlines()
+        if (line := raw.strip())
+    ]
+
+
 def start_download_video() -> None:
     """Download videos from the provided URLs."""
     if input_type_var.get() != "url":
         messagebox.showwarning("Invalid input", "Please enter video URLs to download")
         return
 
-    sources = [
-        line.strip()
-        for line in url_text.get("1.0", tk.END).splitlines()
-        if line.strip()
-    ]
+    sources = get_url_sources()
     if not sources:
         messagebox.showwarning("Missing source", "Please provide a URL.")
         return
@@ -116,27 +183,22 @@ def start_download_video() -> None:
     transcribe_status_var.set("Starting...")
     skip_count_var.set("Skipped: 0")
 
-    def update_progress(percent: float, status: str | None = None) -> None:
-        def _update() -> None:
-            transcribe_progress_var.set(percent)
-            if status is not None:
-                transcribe_status_var.set(status)
-
-        root.after(0, _update)
+    update_progress = make_progress_updater(
+        transcribe_progress_var, transcribe_status_var
+    )
+    video_dir = get_default_video_dir()
 
     def task() -> None:
         try:
             module = ensure_process_loaded()
-            entries = module.prepare_video_entries(
-                sources, get_default_video_dir()
-            )
+            entries = module.prepare_video_entries(sources, video_dir)
             skipped_initial = sum(1 for _, _, _, exists in entries if exists)
             root.after(
                 0, lambda: skip_count_var.set(f"Skipped: {skipped_initial}")
             )
             paths, skipped = module.download_videos(
                 sources,
-                get_default_video_dir(),
+                video_dir,
                 progress_callback=update_progress,
                 entries=entries,
             )
@@ -154,7 +216,7 @@ def start_download_video() -> None:
                 lambda msg=error_message: messagebox.showerror("Download Failed", msg),
             )
 
-    threading.Thread(target=task, daemon=True).start()
+    threading.Thread(target=task, daemon=True, name="download-video").start()
 
 
 def start_audio_conversion() -> None:
@@ -163,11 +225,7 @@ def start_audio_conversion() -> None:
         messagebox.showwarning("Invalid input", "Please enter video URLs to convert")
         return
 
-    sources = [
-        line.strip()
-        for line in url_text.get("1.0", tk.END).splitlines()
-        if line.strip()
-    ]
+    sources = get_url_sources()
     if not sources:
         messagebox.showwarning("Missing source", "Please provide a URL.")
         return
@@ -176,27 +234,22 @@ def start_audio_conversion() -> None:
     transcribe_status_var.set("Starting...")
     skip_count_var.set("Skipped: 0")
 
-    def update_progress(percent: float, status: str | None = None) -> None:
-        def _update() -> None:
-            transcribe_progress_var.set(percent)
-            if status is not None:
-                transcribe_status_var.set(status)
-
-        root.after(0, _update)
+    update_progress = make_progress_updater(
+        transcribe_progress_var, transcribe_status_var
+    )
+    output_dir = output_dir_var.get()
 
     def task() -> None:
         try:
             module = ensure_process_loaded()
-            entries = module.prepare_audio_entries(
-                sources, output_dir_var.get()
-            )
+            entries = module.prepare_audio_entries(sources, output_dir)
             skipped_initial = sum(1 for _, _, _, exists in entries if exists)
             root.after(
                 0, lambda: skip_count_var.set(f"Skipped: {skipped_initial}")
             )
             paths, skipped = module.convert_to_audio_batch(
                 sources,
-                output_dir_var.get(),
+                output_dir,
                 progress_callback=update_progress,
                 entries=entries,
             )
@@ -219,17 +272,13 @@ def start_audio_conversion() -> None:
                 ),
             )
 
-    threading.Thread(target=task, daemon=True).start()
+    threading.Thread(target=task, daemon=True, name="audio-conversion").start()
 
 
 def start_transcription() -> None:
     """Run the transcription step in a background thread."""
     if input_type_var.get() == "url":
-        sources = [
-            line.strip()
-            for line in url_text.get("1.0", tk.END).splitlines()
-            if line.strip()
-        ]
+        sources = get_url_sources()
     else:
         sources = audio_files.copy()
 
@@ -243,19 +292,17 @@ def start_transcription() -> None:
     transcribe_status_var.set("Starting...")
     skip_count_var.set("Skipped: 0")
 
-    def update_progress(percent: float, status: str | None = None) -> None:
-        def _update() -> None:
-            transcribe_progress_var.set(percent)
-            if status is not None:
-                transcribe_status_var.set(status)
-
-        root.after(0, _update)
+    update_progress = make_progress_updater(
+        transcribe_progress_var, transcribe_status_var
+    )
+    input_type = input_type_var.get()
+    output_dir = output_dir_var.get()
 
     def task() -> None:
         try:
             module = ensure_process_loaded()
             entries = module.prepare_transcription_entries(
-                sources, input_type_var.get(), output_dir_var.get()
+                sources, input_type, output_dir
             )
             skipped_initial = sum(1 for _, _, _, exists in entries if exists)
             root.after(
@@ -263,21 +310,24 @@ def start_transcription() -> None:
             )
             paths, skipped = module.transcribe_batch(
                 sources,
-                input_type_var.get(),
+                input_type,
                 language_var.get(),
                 whisper_model_var.get(),
-                output_dir_var.get(),
+                output_dir,
                 progress_callback=update_progress,
                 entries=entries,
             )
             transcript_path_var.set(paths[0] if paths else "")
-            texts = []
-            for p in paths:
-                t = Path(p).read_text(encoding="utf-8")
-                texts.append(f"--- {Path(p).name} ---\n{t}")
-            combined = "\n\n".join(texts)
             root.after(0, lambda: transcript_text.delete("1.0", tk.END))
-            root.after(0, lambda: transcript_text.insert(tk.END, combined))
+            # Stream one transcript at a time into the widget instead of
+            # concatenating all of them into a single in-memory string.
+            for index, p in enumerate(paths):
+                chunk = f"--- {Path(p).name} ---\n" + Path(p).read_text(
+                    encoding="utf-8"
+                )
+                if index:
+                    chunk = "\n\n" + chunk
+                root.after(0, lambda c=chunk: transcript_text.insert(tk.END, c))
             root.after(0, lambda: transcribe_status_var.set(f"Saved {len(paths)} transcripts"))
             root.after(0, lambda: skip_count_var.set(f"Skipped: {skipped}"))
         except Exception as exc:  # pragma: no cover - GUI error path
@@ -285,9 +335,9 @@ def start_transcription() -> None:
             root.after(0, lambda: transcribe_status_var.set("Error"))
             root.after(0, lambda msg=error_message: messagebox.showerror("Error", msg))
         finally:
-            set_default_output_dir(output_dir_var.get())
+            set_default_output_dir(output_dir)
 
-    threading.Thread(target=task, daemon=True).start()
+    threading.Thread(target=task, daemon=True, name="transcription").start()
 
 
 def start_summary() -> None:
@@ -297,17 +347,12 @@ def start_summary() -> None:
         messagebox.showwarning("No transcript", "Run transcription first.")
         return
 
-    Path(path).write_text(transcript_text.get("1.0", tk.END).strip(), encoding="utf-8")
+    edited_transcript = transcript_text.get("1.0", tk.END).strip()
+    Path(path).write_text(edited_transcript, encoding="utf-8")
     summary_progress_var.set(0)
     summary_status_var.set("Starting...")
 
-    def update_progress(percent: float, status: str | None = None) -> None:
-        def _update() -> None:
-            summary_progress_var.set(percent)
-            if status is not None:
-                summary_status_var.set(status)
-
-        root.after(0, _update)
+    update_progress = make_progress_updater(summary_progress_var, summary_status_var)
 
     def task() -> None:
         try:
@@ -317,17 +362,17 @@ def start_summary() -> None:
                 gpt_model_var.get(),
                 prompt_var.get(),
                 progress_callback=update_progress,
+                transcript_text=edited_transcript,
             )
             text = Path(summary_path).read_text(encoding="utf-8")
-            root.after(0, lambda: summary_output.delete("1.0", tk.END))
-            root.after(0, lambda: summary_output.insert(tk.END, text))
+            set_text_widget(summary_output, text)
             root.after(0, lambda: summary_status_var.set("Saved summary"))
         except Exception as exc:  # pragma: no cover - GUI error path
             error_message = str(exc)
             root.after(0, lambda: summary_status_var.set("Error"))
             root.after(0, lambda msg=error_message: messagebox.showerror("Error", msg))
 
-    threading.Thread(target=task, daemon=True).start()
+    threading.Thread(target=task, daemon=True, name="summary").start()
 
 
 root = tk.Tk()
@@ -463,8 +508,11 @@ transcript_path_var = tk.StringVar(value="")
 
 toggle_input_fields()
 
-# Begin loading heavy dependencies after the UI is ready.
-threading.Thread(target=load_process_module, daemon=True).start()
+# Begin loading heavy dependencies after the UI is ready; the selected
+# Whisper model is read here on the main thread and warmed in the background.
+threading.Thread(
+    target=load_process_module, args=(whisper_model_var.get(),), daemon=True
+).start()
 
 if __name__ == "__main__":
     root.mainloop()